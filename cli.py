@@ -0,0 +1,179 @@
+"""
+SkyNetOps command line.
+
+    python cli.py sync cisco_ios SWITCH_DC SWITCH_DC
+    python cli.py detect 85.202.58.98 -u admin -p ...
+    python cli.py fleet inventory.csv
+    python cli.py cache-stats SWITCH_DC
+    python cli.py bench
+
+Heavy dependencies (pynetbox, netmiko/paramiko, openai, rich, pydantic) are imported
+inside the subcommand handlers, so every invocation loads only what it needs.
+"""
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import time
+
+def _since_process_start() -> float:
+    """Seconds since the interpreter process started (Linux /proc, ~10 ms resolution); CPU time elsewhere."""
+    try:
+        with open("/proc/self/stat", encoding="ascii") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, AttributeError, ValueError, IndexError):
+        return time.process_time()
+
+def _executor(workers: int):
+    # pula procesów dla fleet - jedno urządzenie na proces; 0 -> urządzenia po kolei w bieżącym procesie
+    if not workers:
+        return contextlib.nullcontext()
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=workers)
+
+# --- loaders: everything a subcommand imports; main() times them, `bench` runs them in a fresh interpreter ---
+def _load_sync():
+    from main import start
+    return start
+
+def _load_detect():
+    from device_io.ssh import detect_device
+    return detect_device
+
+def _load_fleet():
+    import csv
+    from fleet import sync_fleet
+    return csv, sync_fleet
+
+def _load_cache_stats():
+    from netbox_utils.api import connect_netbox
+    from netbox_utils.state import load_device_state
+    return connect_netbox, load_device_state
+
+def _load_bench():
+    return None
+
+def cmd_sync(args, start) -> int:
+    start(args.device_type, args.device_name, args.host, stream=args.stream)
+    return 0
+
+def cmd_detect(args, detect_device) -> int:
+    detect_device(args.ip, args.username, args.password)
+    return 0
+
+def cmd_fleet(args, deps) -> int:
+    csv, sync_fleet = deps
+
+    # inventory: CSV z kolumnami device_type,device_name,host (linie od '#' pomijane)
+    with open(args.inventory, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(line for line in f if not line.startswith("#")))
+
+    with _executor(args.workers) as executor:
+        failed = sync_fleet(rows, executor, stream=args.stream)
+    for name, e in failed.items():
+        print(f"✖ {name}: {e}", file=sys.stderr)
+
+    print(f"Fleet: {len(rows) - len(failed)}/{len(rows)} devices synced")
+    return 1 if failed else 0
+
+def cmd_cache_stats(args, deps) -> int:
+    connect_netbox, load_device_state = deps
+
+    # cli_hash na interfejsie to "cache" parsowania - interfejs z aktualnym hashem nie idzie do LLM
+    state = load_device_state(connect_netbox(), args.device_name)
+    if state is None:
+        print(f"Device '{args.device_name}' not found in NetBox", file=sys.stderr)
+        return 1
+
+    total = len(state.interfaces)
+    hashed = sum(1 for name in state.interfaces if state.cli_hash(name))
+    ips = sum(len(v) for v in state.ips.values())
+    print(f"{args.device_name}: interfaces={total} with_cli_hash={hashed} without_cli_hash={total - hashed} ips={ips}")
+    return 0
+
+def _startup_time(code: str, repeat: int) -> float:
+    """Best-of-N wall time (s) of `python -c code` - interpreter start included."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=here, capture_output=True, check=True)
+        best = min(best, time.perf_counter() - t)
+    return best
+
+def cmd_bench(args, _) -> int:
+    # lista z samych loaderów - te same importy, które robi subkomenda, bez ręcznie utrzymywanej kopii
+    loaders = sorted(name for name in globals() if name.startswith("_load_") and name != "_load_bench")
+    results = {
+        "python": _startup_time("pass", args.repeat),
+        "cli": _startup_time("import cli", args.repeat),
+    }
+    for loader in loaders:
+        command = loader[len("_load_"):].replace("_", "-")
+        results[command] = _startup_time(f"import cli; cli.{loader}()", args.repeat)
+
+    for name, seconds in results.items():
+        print(f"{name:<12} {seconds * 1000:8.1f} ms")
+
+    if args.output:
+        # historia pomiarów (JSON lines) - do śledzenia regresji czasu startu
+        record = {"ts": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0],
+                  "startup_ms": {k: round(v * 1000, 1) for k, v in results.items()}}
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="skynetops", description="Sync network devices to NetBox.")
+    parser.add_argument("--timings", action="store_true", help="print startup and run time to stderr")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("sync", help="sync a single device to NetBox")
+    p.add_argument("device_type", help="Netmiko device_type, e.g. cisco_ios")
+    p.add_argument("device_name", help="device name in NetBox")
+    p.add_argument("host", help="hostname/IP (or ~/.ssh/config alias)")
+    p.add_argument("--stream", action="store_true", help="read interface output incrementally (flat memory)")
+    p.set_defaults(func=cmd_sync, load=_load_sync)
+
+    p = sub.add_parser("detect", help="detect the device_type of a host")
+    p.add_argument("ip")
+    p.add_argument("-u", "--username", required=True)
+    p.add_argument("-p", "--password", required=True)
+    p.set_defaults(func=cmd_detect, load=_load_detect)
+
+    p = sub.add_parser("fleet", help="sync every device from an inventory CSV")
+    p.add_argument("inventory", help="CSV with columns device_type,device_name,host")
+    p.add_argument("--stream", action="store_true", help="read interface output incrementally (flat memory)")
+    p.add_argument("-w", "--workers", type=int, default=0, help="devices synced in parallel, one per worker process (0 = one by one)")
+    p.set_defaults(func=cmd_fleet, load=_load_fleet)
+
+    p = sub.add_parser("cache-stats", help="show cli_hash coverage of a device's interfaces")
+    p.add_argument("device_name")
+    p.set_defaults(func=cmd_cache_stats, load=_load_cache_stats)
+
+    p = sub.add_parser("bench", help="measure startup time (process start through imports) of every subcommand")
+    p.add_argument("-n", "--repeat", type=int, default=5, help="runs per measurement (best is reported)")
+    p.add_argument("-o", "--output", help="append results as a JSON line to this file")
+    p.set_defaults(func=cmd_bench, load=_load_bench)
+
+    return parser
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    t = time.perf_counter()
+    deps = args.load()
+    imports = time.perf_counter() - t
+    startup = _since_process_start()
+    try:
+        return args.func(args, deps)
+    finally:
+        if args.timings:
+            # startup: od startu procesu (interpreter + cli + importy subkomendy) do wywołania handlera
+            print(f"startup {startup * 1000:.0f} ms (imports {imports * 1000:.1f} ms), "
+                  f"run {(time.perf_counter() - t - imports) * 1000:.1f} ms", file=sys.stderr)
+
+if __name__ == "__main__":
+    sys.exit(main())
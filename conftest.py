@@ -0,0 +1 @@
+# Root conftest: pytest puts this directory on sys.path, so tests import main/models/... like the app does.
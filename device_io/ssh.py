@@ -1,9 +1,10 @@
 import socket
-from typing import Optional, Dict, List
+import time
+from typing import Optional, Dict, Iterator, List
 
 from netmiko import ConnectHandler
 from netmiko.ssh_autodetect import SSHDetect
-from netmiko.exceptions import NetmikoAuthenticationException, NetmikoTimeoutException
+from netmiko.exceptions import NetmikoAuthenticationException, NetmikoTimeoutException, ReadTimeout
 
 def connect_ssh(host, username, password, device_type):
     netmiko_device = {
@@ -33,6 +34,56 @@ def run_command(conn, command):
     else:
         raise ValueError(f"Nieprawidłowy typ komendy: {type(command)}")
 
+def stream_command(conn, command: str, read_timeout: float = 120.0, poll: float = 0.05) -> Iterator[str]:
+    """
+    Wysyła komendę i zwraca output linia po linii, w miarę jak przychodzi z kanału.
+    W pamięci trzymana jest tylko bieżąca (niepełna) linia - niezależnie od rozmiaru outputu.
+    Kończy się, gdy urządzenie odeśle prompt. Wymaga wyłączonego pagingu.
+    """
+    prompt = conn.find_prompt().strip()
+    conn.write_channel(conn.normalize_cmd(command))
+
+    buf = ""
+    echo_skipped = False
+    deadline = time.monotonic() + read_timeout
+    while True:
+        chunk = conn.read_channel()
+        if not chunk:
+            if time.monotonic() > deadline:
+                raise ReadTimeout(f"Prompt '{prompt}' not seen after '{command}' within {read_timeout}s")
+            time.sleep(poll)
+            continue
+
+        buf += conn.strip_ansi_escape_codes(chunk)
+        *lines, buf = buf.split("\n")
+        for line in lines:
+            line = line.rstrip("\r")
+            if not echo_skipped and command in line:
+                # echo komendy (prompt + komenda)
+                echo_skipped = True
+                continue
+            echo_skipped = True
+            yield line
+
+        if buf.strip() == prompt:
+            return
+
+        # liczymy tylko bezczynność kanału - czas konsumenta (LLM, NetBox) między yieldami się nie wlicza
+        deadline = time.monotonic() + read_timeout
+
+def stream_commands(conn, command, read_timeout: float = 120.0) -> Iterator[str]:
+    """Strumieniowy odpowiednik run_command (str albo lista komend)."""
+    if isinstance(command, str):
+        yield from stream_command(conn, command, read_timeout)
+
+    elif isinstance(command, (list, tuple)):
+        for cmd in command:
+            yield f"### COMMAND: {cmd}"
+            yield from stream_command(conn, cmd, read_timeout)
+
+    else:
+        raise ValueError(f"Nieprawidłowy typ komendy: {type(command)}")
+
 def disable_paging(conn, device_type: str):
     dt = device_type.lower()
     try:
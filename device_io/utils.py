@@ -1,4 +1,7 @@
 import re
+from typing import Iterable, Iterator, Tuple
+
+INTERFACE_HEADER = re.compile(r"^interface\s+([\w\/\.\-]+)")
 
 def extract_interface_section(cli_text: str, interface_name: str) -> str:
     """
@@ -6,4 +9,22 @@ def extract_interface_section(cli_text: str, interface_name: str) -> str:
     """
     pattern = rf"^interface {re.escape(interface_name)}[\s\S]*?(?=^interface |\Z)"
     match = re.search(pattern, cli_text, re.MULTILINE)
-    return match.group(0).strip() if match else ""
\ No newline at end of file
+    return match.group(0).strip() if match else ""
+
+def iter_interface_sections(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Strumieniowo dzieli output na sekcje interface <name> -> (name, section).
+    Sekcja kończy się na pierwszej linii zaczynającej się w kolumnie 0, więc w pamięci
+    jest tylko bieżąca sekcja. Linie spoza sekcji (np. '### COMMAND: ...') są pomijane.
+    """
+    name, section = None, []
+    for line in lines:
+        if line[:1] not in ("", " ", "\t"):
+            if name:
+                yield name, "\n".join(section).strip()
+            m = INTERFACE_HEADER.match(line)
+            name, section = (m.group(1), [line]) if m else (None, [])
+        elif name:
+            section.append(line)
+    if name:
+        yield name, "\n".join(section).strip()
\ No newline at end of file
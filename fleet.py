@@ -0,0 +1,71 @@
+from concurrent.futures import Executor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+from main import collect_facts, start
+from netbox_utils.api import connect_netbox
+from netbox_utils.dcim.device import ensure_devices_registered, find_devices
+
+def run_jobs(fn: Callable, jobs: Dict[str, tuple], executor: Optional[Executor] = None) -> Dict[str, Any]:
+    """
+    Runs fn(*args) for every job - one after another, or in the process pool when an executor is given.
+    Returns {key: result}; a job that raised has the exception as its result.
+    """
+    results: Dict[str, Any] = {}
+    if executor is None:
+        for key, args in jobs.items():
+            try:
+                results[key] = fn(*args)
+            except Exception as e:
+                results[key] = e
+        return results
+
+    futures = {executor.submit(fn, *args): key for key, args in jobs.items()}
+    for future in as_completed(futures):
+        try:
+            results[futures[future]] = future.result()
+        except Exception as e:
+            results[futures[future]] = e
+    return results
+
+def onboard_fleet(nb, rows: List[Dict[str, str]], executor: Optional[Executor] = None) -> Dict[str, Exception]:
+    """
+    Registers inventory devices that are not in NetBox yet: facts are collected per device
+    (in the pool when given), then all devices are created with ensure_devices_registered's bulk requests.
+    Returns {device_name: exception} for devices that could not be onboarded.
+    """
+    by_name = {row["device_name"]: row for row in rows}
+    existing = find_devices(nb, by_name)
+    missing = {name: row for name, row in by_name.items() if name not in existing}
+    if not missing:
+        return {}
+
+    facts = run_jobs(collect_facts, {name: (row["device_type"], row["host"]) for name, row in missing.items()}, executor)
+    failed: Dict[str, Exception] = {name: f for name, f in facts.items() if isinstance(f, Exception)}
+
+    devices = [(name, missing[name]["device_type"], f) for name, f in facts.items() if name not in failed]
+    _, created, rejected = ensure_devices_registered(nb, devices)
+    for name, reason in rejected.items():
+        failed[name] = ValueError(f"not registered in NetBox: {reason}")
+    print(f"Onboarded {len(created)}/{len(missing)} new devices")
+    return failed
+
+def sync_fleet(rows: List[Dict[str, str]], executor: Optional[Executor] = None, stream: bool = False, nb=None) -> Dict[str, Exception]:
+    """
+    Onboards devices missing from NetBox in bulk, then syncs every inventory row
+    (device_type, device_name, host) with main.start.
+    Each device - SSH collection, section splitting, hashing, parsing and NetBox writes - runs
+    as one job, so with a process pool devices are synced in parallel on all cores.
+    Returns {device_name: exception} for devices that failed.
+    """
+    try:
+        failed = onboard_fleet(nb or connect_netbox(), rows, executor)
+    except Exception as e:
+        # bulk rejestracja padła w całości - start i tak spróbuje zarejestrować każde urządzenie osobno
+        print(f"Bulk onboarding failed: {e}")
+        failed = {}
+
+    jobs = {row["device_name"]: (row["device_type"], row["device_name"], row["host"], stream)
+            for row in rows if row["device_name"] not in failed}
+    results = run_jobs(start, jobs, executor)
+    failed.update({name: result for name, result in results.items() if isinstance(result, Exception)})
+    return failed
@@ -4,8 +4,7 @@ class DeviceEnsureError(Exception):
 class NetBoxCreateError(Exception):
     pass
 
-import pynetbox
-from device_io.ssh import connect_ssh, disable_paging, run_command, detect_device
+from device_io.ssh import connect_ssh, disable_paging, run_command, stream_commands, detect_device
 from device_io.commands import get_command, SHOW_VERSION, SHOW_INTERFACES
 from rich.console import Console
 from netbox_utils.dcim.device import ensure_device_registered
@@ -13,17 +12,68 @@ from netbox_utils.dcim.interface import upsert_interface
 from netbox_utils.utils import sha256_of, clear_ips
 from parsers.ai_parser import parse_cli_to_model
 from models import Facts, Interface
-from device_io.utils import extract_interface_section
+from device_io.utils import iter_interface_sections
 from netbox_utils.ipam.ip import get_or_create_ip
-import re
+from netbox_utils.state import DeviceState, load_device_state
+from netbox_utils.api import connect_netbox
 
 console = Console()
 
-def start(device_type: str, device_name: str, host: str):
+def sync_interface(nb, device, state: DeviceState, iface_name: str, iface_cli: str, vendor: str | None = None):
+    # Porównuje hash sekcji z NetBox; w przypadku różnicy parsuje sekcję i aktualizuje interfejs/IP.
+    iface = state.interface(iface_name)
+    if iface is None:
+        iface, created, changed = upsert_interface(nb=nb, device_id=device.id, if_name=iface_name)
+        state.add_interface(iface)
+
+    if not iface:
+        raise Exception("Coś poszło nie tak")
+
+    new_hash = sha256_of(iface_cli)
+    old_hash = state.cli_hash(iface_name)
+
+    if new_hash != old_hash:
+        iface_parsed: Interface = parse_cli_to_model(iface_cli, Interface, vendor=vendor)
+        iface, created, changed = upsert_interface(nb=nb, device_id=device.id, if_name=iface_name, description=iface_parsed.description, iface=iface)
+
+        # Oczyścić interfejś od "starych" IP; snapshot trzyma tylko te, które zostały
+        kept = clear_ips(nb, iface_parsed.ipv4, iface, nb_ips=state.interface_ips(iface.id))
+        state.set_interface_ips(iface.id, kept)
+
+        is_ok: bool = True
+
+        for ip in iface_parsed.ipv4:
+            try:
+                nb_ip = get_or_create_ip(nb, device, ip.address, ip.is_primary, iface, existing=state.ip(iface.id, ip.address))
+            except Exception as e:
+                is_ok = False
+                continue
+
+        if is_ok:
+            # Hash interfejsu zapisuje wyłącznie wtedy, gdy wszystkie dane zostały pomyślnie zaktualizowane.
+            iface, created, changed = upsert_interface(nb, device.id, iface_name, description=iface_parsed.description, cli_hash=new_hash, iface=iface)
+
+            if changed:
+                print(f"Interface {iface.name} has changed")
+
+def read_facts(conn, device_type: str) -> Facts:
+    # 'show version' -> Facts (vendor, model, serial, rola) potrzebne do rejestracji urządzenia w NetBox
+    disable_paging(conn, device_type)
+    cmds = get_command(SHOW_VERSION, device_type, default="show version")
+    facts_cli = run_command(conn=conn, command=cmds)
+    return parse_cli_to_model(facts_cli, Facts, vendor=device_type)
+
+def collect_facts(device_type: str, host: str) -> Facts:
+    # Osobne połączenie tylko po Facts - fleet rejestruje brakujące urządzenia hurtem przed synchronizacją
+    conn = connect_ssh(host, "admin", "Op2oyxq##", device_type)
+    try:
+        return read_facts(conn, device_type)
+    finally:
+        conn.disconnect()
+
+def start(device_type: str, device_name: str, host: str, stream: bool = False):
     # Connecting to NetBox
-    nb = pynetbox.api(
-        "http://10.8.0.3:8000", token="1ce666a0d2b006213716c1372f4704a94256c21d"
-    )
+    nb = connect_netbox()
 
     # =============== Connecting to the device (Netmiko) ====================
     console.print(f"[bold]🔌 Connecting[/] to {host}")
@@ -35,15 +85,15 @@ def start(device_type: str, device_name: str, host: str):
 
     # =========== Collect facts and create device in NetBox ==============
     try:
-        device, created = ensure_device_registered(nb, device_name=device_name, facts={})
+        # Current NetBox picture of the device (device, interfaces, IPs) in a fixed number of requests
+        state = load_device_state(nb, device_name)
+        device, created = (state.device, False) if state else (None, False)
 
         if not device and not created:
             # Device not exist
-            disable_paging(conn, device_type)
-            cmds = get_command(SHOW_VERSION, device_type, default="show version")
-            facts_cli = run_command(conn=conn, command=cmds)
-            facts = parse_cli_to_model(facts_cli, Facts)
+            facts = read_facts(conn, device_type)
             device, created = ensure_device_registered(nb, device_name=device_name, facts=facts)
+            state = DeviceState(device=device)
 
         if created:
             console.print(f"[green]✔ Created device[/] [yellow]{device.name}[/] in NetBox")
@@ -57,45 +107,20 @@ def start(device_type: str, device_name: str, host: str):
         # 1. Get all interfaces (CLI)
         cmds = get_command(SHOW_INTERFACES, device_type, default="show interfaces")
         # cmds = [cmd.format(interface="") for cmd in SHOW_INTERFACES[device_type]]
-        interfaces_cli = run_command(conn=conn, command=cmds)
 
-        # 2. Interfaces CLI -> dict
-        interfaces = re.findall(r'^\s*interface\s+([\w\/\.\-]+)', interfaces_cli, flags=re.MULTILINE)
+        # 2. Interfaces CLI -> (name, section)
+        if stream:
+            # sekcje parsowane w miarę jak przychodzą z kanału - pamięć nie rośnie z rozmiarem outputu
+            sections = iter_interface_sections(stream_commands(conn, cmds))
+        else:
+            # ten sam podział co w trybie stream - ten sam cli_hash niezależnie od trybu
+            interfaces_cli = run_command(conn=conn, command=cmds)
+            sections = iter_interface_sections(interfaces_cli.splitlines())
 
-        for iface_name in interfaces:
+        for iface_name, iface_cli in sections:
             print(f"Check {iface_name}\n")
             # 3. Sprawdzam po kolei sumy kontrolne (hash) wszystkich interfejsów w przypadku różnic parsuję i aktualizuję.
-            iface_cli = extract_interface_section(interfaces_cli, iface_name)
-            iface, created, changed = upsert_interface(nb=nb, device_id=device.id, if_name=iface_name)
-
-            if not iface:
-                raise Exception("Coś poszło nie tak")
-
-            new_hash = sha256_of(iface_cli)
-            old_hash = (iface.custom_fields or {}).get("cli_hash")
-
-            if new_hash != old_hash:
-                iface_parsed: Interface = parse_cli_to_model(iface_cli, Interface)
-                iface, created, changed = upsert_interface(nb=nb, device_id=device.id, if_name=iface_name, description=iface_parsed.description)
-
-                # Oczyścić interfejś od "starych" IP
-                clear_ips(nb, iface_parsed.ipv4, iface)
-
-                is_ok: bool = True
-
-                for ip in iface_parsed.ipv4:
-                    try:
-                        nb_ip = get_or_create_ip(nb, device, ip.address, ip.is_primary, iface)
-                    except Exception as e:
-                        is_ok = False
-                        continue
-
-                if is_ok:
-                    # Hash interfejsu zapisuje wyłącznie wtedy, gdy wszystkie dane zostały pomyślnie zaktualizowane.
-                    iface, created, changed = upsert_interface(nb, device.id, iface_name, description=iface_parsed.description, cli_hash=new_hash)
-
-                    if changed:
-                        print(f"Interface {iface.name} has changed")
+            sync_interface(nb, device, state, iface_name, iface_cli, vendor=device_type)
 
     except Exception as e:
         raise DeviceEnsureError(f"Failed to collect facts for '{device_name}': {e}") from e
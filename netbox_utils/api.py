@@ -0,0 +1,9 @@
+import os
+import pynetbox
+
+NETBOX_URL = os.getenv("NETBOX_URL", "http://10.8.0.3:8000")
+NETBOX_TOKEN = os.getenv("NETBOX_TOKEN", "1ce666a0d2b006213716c1372f4704a94256c21d")
+
+def connect_netbox(url: str | None = None, token: str | None = None):
+    # Connecting to NetBox (NETBOX_URL / NETBOX_TOKEN z env nadpisują domyślne)
+    return pynetbox.api(url or NETBOX_URL, token=token or NETBOX_TOKEN)
@@ -3,12 +3,18 @@ class DeviceEnsureError(Exception):
 class NetBoxCreateError(Exception):
     pass
 
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from models import Facts
+from ..utils import chunks
 from .site import get_or_create_site
-from .manufacturer import get_or_create_manufacturer
-from .device_role import get_or_create_device_role
-from .device_type import get_or_create_device_type
-from .platform import get_or_create_platform
+from .manufacturer import get_or_create_manufacturer, get_or_create_manufacturers
+from .device_role import get_or_create_device_role, get_or_create_device_roles
+from .device_type import get_or_create_device_type, get_or_create_device_types
+from .platform import get_or_create_platform, get_or_create_platforms
+
+# Names per ?name=...&name=... lookup (URL length) and devices per bulk POST
+LOOKUP_BATCH_SIZE = 100
+CREATE_BATCH_SIZE = 1000
 
 def get_or_create_device(nb, *, name: str, site_id: int, role_id: int, device_type_id: int,
                          platform_id: int, status: str = "active", serial_number: str):
@@ -78,4 +84,99 @@ def ensure_device_registered(
         )
         return device, created
     except Exception as e:
-        raise DeviceEnsureError(f"Failed to create device '{device_name}': {e}") from e
\ No newline at end of file
+        raise DeviceEnsureError(f"Failed to create device '{device_name}': {e}") from e
+
+# --- BULK ONBOARDING ---
+def _name_slug(name: str) -> str:
+    return name.lower().replace(" ", "-")
+
+def _reject_reason(device_type: Optional[str], facts: Optional[Facts]) -> Optional[str]:
+    # brakujące pola - rekord odrzucony przed jakimkolwiek zapisem, reszta partii idzie dalej
+    if not device_type:
+        return "missing device_type"
+    if facts is None:
+        return "missing facts"
+    for field in ("vendor", "device_role", "model"):
+        value = getattr(facts, field, None)
+        if not isinstance(value, str) or not value.strip():
+            return f"missing {field}"
+    return None
+
+def find_devices(nb, names: Iterable[str]) -> Dict[str, Any]:
+    """Returns {device_name: device} for names that exist in NetBox, LOOKUP_BATCH_SIZE names per request."""
+    found: Dict[str, Any] = {}
+    for batch in chunks(dict.fromkeys(names), LOOKUP_BATCH_SIZE):
+        found.update({dev.name: dev for dev in nb.dcim.devices.filter(name=batch)})
+    return found
+
+def ensure_devices_registered(
+    nb,
+    devices: Sequence[Tuple[str, str, Optional[Facts]]],
+    site_name: str = "LAB-DC",
+    site_slug: str = "lab-dc",
+) -> Tuple[Dict[str, Any], List[str], Dict[str, str]]:
+    """
+    Bulk variant of ensure_device_registered for onboarding a whole site.
+    devices: (device_name, device_type, facts) for every device.
+    Dependencies are deduplicated and created once; missing devices are created with bulk POSTs.
+    Missing devices without device_type, facts, vendor, device_role or model are not created.
+    Returns: ({device_name: device}, [names of created devices], {rejected device_name: reason})
+    Raises DeviceEnsureError on failure.
+    """
+    wanted = {name: (device_type, facts) for name, device_type, facts in devices}
+
+    # 1. Devices that already exist
+    try:
+        found = find_devices(nb, wanted)
+    except Exception as e:
+        raise DeviceEnsureError(f"Failed to look up devices in NetBox: {e}") from e
+
+    missing: Dict[str, Tuple[str, Facts]] = {}
+    rejected: Dict[str, str] = {}
+    for name, (device_type, facts) in wanted.items():
+        if name in found:
+            continue
+        reason = _reject_reason(device_type, facts)
+        if reason:
+            rejected[name] = reason
+        else:
+            missing[name] = (device_type, facts)
+    if not missing:
+        return found, [], rejected
+
+    # 2. Create/get dependent objects, each kind once
+    try:
+        site = get_or_create_site(nb, site_name, site_slug)
+        manus = get_or_create_manufacturers(nb, {_name_slug(f.vendor): f.vendor for _, f in missing.values()})
+        plats = get_or_create_platforms(nb, (device_type for device_type, _ in missing.values()))
+        roles = get_or_create_device_roles(nb, {_name_slug(f.device_role): f.device_role for _, f in missing.values()})
+        dtypes = get_or_create_device_types(
+            nb, {(manus[_name_slug(f.vendor)].id, f.model) for _, f in missing.values()}
+        )
+    except Exception as e:
+        raise DeviceEnsureError(f"Failed to prepare dependencies in NetBox for {len(missing)} devices: {e}") from e
+
+    # 3. Devices
+    payloads = []
+    for name, (device_type, facts) in missing.items():
+        manu = manus[_name_slug(facts.vendor)]
+        payloads.append({
+            "name": name,
+            "site": site.id,
+            "role": roles[_name_slug(facts.device_role)].id,
+            "platform": plats[device_type].id,
+            "device_type": dtypes[(manu.id, facts.model)].id,
+            "serial": facts.serial_number,
+            "status": "active",
+        })
+
+    created: List[str] = []
+    try:
+        for batch in chunks(payloads, CREATE_BATCH_SIZE):
+            for dev in nb.dcim.devices.create(batch):
+                found[dev.name] = dev
+                created.append(dev.name)
+    except Exception as e:
+        raise DeviceEnsureError(f"Failed to create devices ({len(created)}/{len(payloads)} created): {e}") from e
+
+    return found, created, rejected
\ No newline at end of file
@@ -1,3 +1,4 @@
+from typing import Any, Dict
 from ..utils import first
 
 def get_or_create_device_role(nb, name: str, slug: str):
@@ -5,4 +6,20 @@ def get_or_create_device_role(nb, name: str, slug: str):
     if role:
         return role
     role = first(nb.dcim.device_roles.filter(name=name))
-    return role or nb.dcim.device_roles.create({"name": name, "slug": slug})
\ No newline at end of file
+    return role or nb.dcim.device_roles.create({"name": name, "slug": slug})
+
+def get_or_create_device_roles(nb, names: Dict[str, str]) -> Dict[str, Any]:
+    """names: slug -> name. Returns slug -> role; missing ones are created in one bulk POST."""
+    if not names:
+        return {}
+    found = {r.slug: r for r in nb.dcim.device_roles.filter(slug=list(names))}
+    # fallback po name (np. "switch" istnieje ze slugiem "access-switch") - inaczej POST padnie na unikalnej nazwie
+    by_name = {name: slug for slug, name in names.items() if slug not in found}
+    if by_name:
+        for r in nb.dcim.device_roles.filter(name=list(by_name)):
+            if r.name in by_name:
+                found[by_name[r.name]] = r
+    missing = [{"name": name, "slug": slug} for slug, name in names.items() if slug not in found]
+    if missing:
+        found.update({r.slug: r for r in nb.dcim.device_roles.create(missing)})
+    return found
\ No newline at end of file
@@ -1,5 +1,6 @@
 from netbox_utils.utils import first, _slugify
 from pynetbox.core.query import RequestError
+from typing import Any, Dict, Iterable, Tuple
 
 def get_or_create_device_type(nb, model: str, manufacturer_id: int):
     # 1) jest już taki typ? (najpewniej po parze manufacturer+model)
@@ -46,4 +47,34 @@ def get_or_create_device_type(nb, model: str, manufacturer_id: int):
                     return nb.dcim.device_types.create(payload)
                 except RequestError:
                     continue
-        raise
\ No newline at end of file
+        raise
+
+def get_or_create_device_types(nb, models: Iterable[Tuple[int, str]]) -> Dict[Tuple[int, str], Any]:
+    """
+    models: pary (manufacturer_id, model).
+    Zwraca (manufacturer_id, model) -> device type; brakujące tworzy jednym bulk POST.
+    """
+    wanted = set(models)
+    if not wanted:
+        return {}
+
+    # jedno zapytanie o wszystkie typy tych producentów - daje też zajęte slugi
+    existing = list(nb.dcim.device_types.filter(manufacturer_id=sorted({m for m, _ in wanted})))
+    found = {(dt.manufacturer.id, dt.model): dt for dt in existing}
+    taken = {(dt.manufacturer.id, dt.slug) for dt in existing}
+
+    payloads = []
+    for manufacturer_id, model in sorted(wanted - found.keys()):
+        base = _slugify(model)
+        slug = base
+        i = 2
+        while (manufacturer_id, slug) in taken:
+            slug = f"{base}-{i}"
+            i += 1
+        taken.add((manufacturer_id, slug))
+        payloads.append({"model": model, "manufacturer": manufacturer_id, "slug": slug})
+
+    if payloads:
+        for dt in nb.dcim.device_types.create(payloads):
+            found[(dt.manufacturer.id, dt.model)] = dt
+    return found
\ No newline at end of file
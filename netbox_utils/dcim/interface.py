@@ -12,14 +12,19 @@ def upsert_interface(
     mtu: Optional[int] = None,
     mac_address: Optional[str] = None,
     cli_hash: Optional[str] = None,
+    iface: Any = None,
 ) -> Tuple[Any, bool, bool]:
     """
         Returns: (iface, created, changed)
         created: True if the interface was created
         changed: True if any field was updated
+        iface: already known record (e.g. from DeviceState) - skips the lookup and the refresh
     """
+    known = iface is not None
+
     # 1) Searching for the interface
-    iface = first(nb.dcim.interfaces.filter(device_id=device_id, name=if_name))
+    if not known:
+        iface = first(nb.dcim.interfaces.filter(device_id=device_id, name=if_name))
 
     # 2) If it doesn’t exist – create a baseline (only what MUST be present)
     if iface is None:
@@ -70,7 +75,8 @@ def upsert_interface(
     changed = bool(patch)
     if changed:
         iface.update(patch)
-        # refresh (includes custom_fields)
-        iface = next(iter(nb.dcim.interfaces.filter(device_id=device_id, name=if_name)), iface)
+        # refresh (includes custom_fields); a known record is already patched in place
+        if not known:
+            iface = next(iter(nb.dcim.interfaces.filter(device_id=device_id, name=if_name)), iface)
 
     return iface, created, changed
\ No newline at end of file
@@ -1,3 +1,4 @@
+from typing import Any, Dict
 from ..utils import first
 
 def get_or_create_manufacturer(nb, name: str, slug: str):
@@ -5,4 +6,20 @@ def get_or_create_manufacturer(nb, name: str, slug: str):
     if manu:
         return manu
     manu = first(nb.dcim.manufacturers.filter(name=name))
-    return manu or nb.dcim.manufacturers.create({"name": name, "slug": slug})
\ No newline at end of file
+    return manu or nb.dcim.manufacturers.create({"name": name, "slug": slug})
+
+def get_or_create_manufacturers(nb, names: Dict[str, str]) -> Dict[str, Any]:
+    """names: slug -> name. Returns slug -> manufacturer; missing ones are created in one bulk POST."""
+    if not names:
+        return {}
+    found = {m.slug: m for m in nb.dcim.manufacturers.filter(slug=list(names))}
+    # fallback po name (np. "Cisco" istnieje ze slugiem "cisco-systems") - inaczej POST padnie na unikalnej nazwie
+    by_name = {name: slug for slug, name in names.items() if slug not in found}
+    if by_name:
+        for m in nb.dcim.manufacturers.filter(name=list(by_name)):
+            if m.name in by_name:
+                found[by_name[m.name]] = m
+    missing = [{"name": name, "slug": slug} for slug, name in names.items() if slug not in found]
+    if missing:
+        found.update({m.slug: m for m in nb.dcim.manufacturers.create(missing)})
+    return found
\ No newline at end of file
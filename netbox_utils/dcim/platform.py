@@ -1,3 +1,4 @@
+from typing import Any, Dict, Iterable
 from ..utils import _slugify
 
 def get_or_create_platform(nb, name: str):
@@ -5,4 +6,15 @@ def get_or_create_platform(nb, name: str):
     if p:
         return p
 
-    return nb.dcim.platforms.create({"name": name,"slug": _slugify(name)})
\ No newline at end of file
+    return nb.dcim.platforms.create({"name": name,"slug": _slugify(name)})
+
+def get_or_create_platforms(nb, names: Iterable[str]) -> Dict[str, Any]:
+    """Returns name -> platform; missing ones are created in one bulk POST."""
+    names = sorted(set(names))
+    if not names:
+        return {}
+    found = {p.name: p for p in nb.dcim.platforms.filter(name=names)}
+    missing = [{"name": name, "slug": _slugify(name)} for name in names if name not in found]
+    if missing:
+        found.update({p.name: p for p in nb.dcim.platforms.create(missing)})
+    return found
\ No newline at end of file
@@ -2,14 +2,19 @@ from models import Interface
 from ..utils import is_management_interface, is_primary_interface
 
 def get_or_create_ip(
-    nb, device, address: str, is_primary: bool, interface: Interface, status: str = "active"
+    nb, device, address: str, is_primary: bool, interface: Interface, status: str = "active", existing=None
 ):
-    # 1. Check if the IP already exists
-    results = nb.ipam.ip_addresses.filter(address=address)
-    existing_ip = next(iter(results), None)  # Take the first result or None
+    # 1. Check if the IP already exists (existing: record already known from DeviceState)
+    if existing is not None:
+        existing_ip = existing
+    else:
+        results = nb.ipam.ip_addresses.filter(address=address)
+        existing_ip = next(iter(results), None)  # Take the first result or None
 
     if existing_ip:
-        if existing_ip.assigned_object is None:
+        if existing_ip.assigned_object_id == interface.id:
+            pass  # already assigned to this interface
+        elif existing_ip.assigned_object is None:
             print("The IP is not assigned to any interface")
             existing_ip.assigned_object_type = "dcim.interface"
             existing_ip.assigned_object_id = interface.id
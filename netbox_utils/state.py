@@ -0,0 +1,57 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# Page size for list calls; NetBox caps it at MAX_PAGE_SIZE (1000 by default).
+PAGE_SIZE = 1000
+
+@dataclass
+class DeviceState:
+    """
+    In-memory snapshot of a device as NetBox currently sees it.
+    Built once per sync; the rest of the sync diffs against it instead of querying per interface.
+    """
+    device: Any
+    interfaces: Dict[str, Any] = field(default_factory=dict)      # name -> interface record
+    ips: Dict[int, List[Any]] = field(default_factory=dict)       # interface id -> [ip records]
+
+    def interface(self, name: str) -> Optional[Any]:
+        return self.interfaces.get(name)
+
+    def cli_hash(self, name: str) -> Optional[str]:
+        iface = self.interfaces.get(name)
+        if iface is None:
+            return None
+        return (iface.custom_fields or {}).get("cli_hash")
+
+    def interface_ips(self, iface_id: int) -> List[Any]:
+        return self.ips.get(iface_id, [])
+
+    def ip(self, iface_id: int, address: str) -> Optional[Any]:
+        return next((ip for ip in self.interface_ips(iface_id) if ip.address == address), None)
+
+    def set_interface_ips(self, iface_id: int, ips: List[Any]) -> None:
+        self.ips[iface_id] = list(ips)
+
+    def add_interface(self, iface) -> None:
+        self.interfaces[iface.name] = iface
+
+def load_device_state(nb, device_name: str) -> Optional[DeviceState]:
+    """
+    Loads device, its interfaces (with custom_fields) and assigned IPs using three list calls,
+    independent of the number of ports. Returns None if the device does not exist in NetBox.
+    """
+    device = nb.dcim.devices.get(name=device_name)
+    if not device:
+        return None
+
+    state = DeviceState(device=device)
+
+    for iface in nb.dcim.interfaces.filter(device_id=device.id, limit=PAGE_SIZE):
+        state.interfaces[iface.name] = iface
+
+    for ip in nb.ipam.ip_addresses.filter(device_id=device.id, limit=PAGE_SIZE):
+        if ip.assigned_object_type != "dcim.interface" or ip.assigned_object_id is None:
+            continue
+        state.ips.setdefault(ip.assigned_object_id, []).append(ip)
+
+    return state
@@ -7,6 +7,12 @@ def first(recordset):
     """Zwraca pierwszy element RecordSet albo None."""
     return next(iter(recordset), None)
 
+def chunks(items, size: int):
+    """Dzieli listę na kawałki po `size` elementów (bulk POST / długość URL przy filtrach)."""
+    items = list(items)
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
 def _slugify(s: str) -> str:
     s = s.strip().lower()
     s = re.sub(r"[^a-z0-9\-]+", "-", s)  # zamień nie-alfanum na '-'
@@ -36,13 +42,20 @@ def _norm_mac(mac: str) -> str:
 def sha256_of(text: str) -> str:
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
-def clear_ips(nb, ips: List[IPv4], iface):
+def clear_ips(nb, ips: List[IPv4], iface, nb_ips=None) -> list:
     # Tutaj "usuwamy" IP których już nie ma na tym interfejście
-    nb_ips = nb.ipam.ip_addresses.filter(assigned_object_id=iface.id)
+    # nb_ips: IP przypisane do interfejsu (np. z DeviceState) - pomija zapytanie do NetBox
+    # Zwraca IP, które zostały (bez usuniętych)
+    if nb_ips is None:
+        nb_ips = nb.ipam.ip_addresses.filter(assigned_object_id=iface.id)
+    kept = []
     for np_ip in nb_ips:
-        found = next((ip for ip in ips if ip.address == np_ip), None)
+        found = next((ip for ip in ips if ip.address == str(np_ip.address)), None)
         if not found:
             np_ip.delete()
+        else:
+            kept.append(np_ip)
+    return kept
 
 def is_management_interface(name: str, description: str = "") -> bool:
     text = f"{name} {description}".lower()
@@ -1,13 +1,16 @@
-from openai import OpenAI
 from typing import Type, TypeVar
 from pydantic import BaseModel
 import os
 from pathlib import Path
-from dotenv import load_dotenv, find_dotenv
+from parsers.minimize import minimize_section, count_tokens
 
 T = TypeVar("T", bound=BaseModel)
 
-def parse_cli_to_model(section_cli, schema: Type[T]):
+def parse_cli_to_model(section_cli, schema: Type[T], vendor: str | None = None, minimize: bool = True):
+    # openai/dotenv ładujemy dopiero przy pierwszym parsowaniu - sync bez zmian w ogóle ich nie importuje
+    from openai import OpenAI
+    from dotenv import load_dotenv, find_dotenv
+
     # Bezpieczne wyszukiwanie .env w górę od pliku startowego
     env_path = find_dotenv() or (Path(__file__).resolve().parent / ".env")
     load_dotenv(env_path)
@@ -21,6 +24,13 @@ def parse_cli_to_model(section_cli, schema: Type[T]):
     with open(file_path, "r", encoding="utf-8") as f:
         SYSTEM_PROMPT = f.read()
 
+    # Do LLM idzie tylko to, czego używa schemat; hash liczony jest z oryginału po stronie wywołującego
+    if minimize:
+        reduced = minimize_section(section_cli, schema, vendor)
+        before, after = count_tokens(section_cli), count_tokens(reduced)
+        print(f"Tokens ({schema.__name__}): {before} -> {after} (saved {before - after})")
+        section_cli = reduced
+
     resp = client.responses.parse(
         model=model,
         input=[
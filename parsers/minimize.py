@@ -0,0 +1,93 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Pattern, Tuple, Type
+
+from pydantic import BaseModel
+
+@dataclass(frozen=True)
+class Rules:
+    """
+    Line filter for one (schema, vendor). A line is sent to the LLM when it does not
+    match `drop` and - if `keep` is set - matches `keep`.
+    """
+    keep: Optional[Pattern] = None
+    drop: Optional[Pattern] = None
+
+def _re(*patterns: str) -> Pattern:
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+# Always useless for the parser: blank lines, '!' separators, comments, our '### COMMAND' markers
+ALWAYS_DROP = _re(r"^\s*$", r"^\s*!", r"^\s*#")
+
+# --- Interface: only lines that feed Interface fields (see models.Interface) ---
+_IFACE_CISCO = (
+    r"^(?-i:interface)\s",                             # name (Dell "Interface index is ..." is not)
+    r"^\s*description\s",
+    r"^\s*(no\s+)?shutdown\b",                         # is_enabled
+    r"^\s*ip address\s",                               # ipv4 (incl. secondary)
+    r"^\s*switchport (mode|access vlan|trunk (allowed|native) vlan)\b",
+    r"^\s*encapsulation dot1q\b",                      # vlan_subinterface
+    r"^\s*(mtu|ip mtu|speed|mac-address)\s",
+    r"\bline protocol is\b",                           # is_up ('show interfaces')
+    r"\baddress is\b",                                 # mac / 'Internet address is'
+    r"\bMTU \d+",
+)
+_IFACE_DELL = _IFACE_CISCO + (
+    r"^\s*vlan-id dot1q\b",
+    r"^\s*Description:",
+    r"\bLineSpeed\b",                                  # speed ('show interfaces')
+)
+
+# --- Facts: 'show version' is short, but Cisco carries long legal/boot text ---
+_FACTS_DROP = (
+    r"copyright", r"https?://", r"cryptographic", r"export", r"third-party", r"\blaws?\b",
+    r"\bagree", r"licen[cs]", r"technical support", r"^\s*compiled\b", r"^\s*ROM:", r"BOOTLDR",
+    r"configuration register", r"last reload", r"system returned to",
+)
+
+RULES: Dict[Tuple[str, str], Rules] = {
+    ("Interface", "cisco_ios"): Rules(keep=_re(*_IFACE_CISCO)),
+    ("Interface", "dell_os10"): Rules(keep=_re(*_IFACE_DELL)),
+    # FortiGate 'get system interface' is one dense line per interface - only ALWAYS_DROP applies
+    ("Interface", "fortinet"): Rules(),
+    # Vendors without explicit rules (Junos, Huawei, Mikrotik, ...) - a keep-list built for
+    # IOS syntax would drop e.g. 'address 10.0.0.1/24;' or 'undo shutdown'
+    ("Interface", "*"): Rules(),
+    ("Facts", "*"): Rules(drop=_re(*_FACTS_DROP)),
+}
+
+def rules_for(schema: Type[BaseModel], vendor: Optional[str]) -> Rules:
+    name = schema.__name__
+    return RULES.get((name, vendor), RULES.get((name, "*"), Rules()))
+
+def minimize_section(section_cli: str, schema: Type[BaseModel], vendor: Optional[str] = None) -> str:
+    """
+    Strips lines the target schema never uses. Only the text sent to the LLM is reduced -
+    hashing (cli_hash) must keep using the original section.
+    Falls back to the original text if nothing would be left.
+    """
+    rules = rules_for(schema, vendor)
+    lines = []
+    for line in section_cli.splitlines():
+        if ALWAYS_DROP.search(line):
+            continue
+        if rules.drop and rules.drop.search(line):
+            continue
+        if rules.keep and not rules.keep.search(line):
+            continue
+        lines.append(line.rstrip())
+
+    return "\n".join(lines) if lines else section_cli
+
+@lru_cache(maxsize=1)
+def _encoding():
+    try:
+        import tiktoken  # opcjonalne - bez niego szacujemy ~4 znaki/token
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+def count_tokens(text: str) -> int:
+    enc = _encoding()
+    return len(enc.encode(text)) if enc else (len(text) + 3) // 4
@@ -0,0 +1,72 @@
+import itertools
+from types import SimpleNamespace
+
+class FakeRecord(SimpleNamespace):
+    def __init__(self, endpoint=None, **kw):
+        super().__init__(**kw)
+        self._endpoint = endpoint
+
+    def delete(self):
+        self._endpoint.rows.remove(self)
+        return True
+
+    def update(self, data):
+        for k, v in data.items():
+            setattr(self, k, v)
+        return True
+
+    def save(self):
+        return True
+
+class FakeEndpoint:
+    """Minimal pynetbox endpoint: every get/filter/create is one request in nb.requests."""
+    ids = itertools.count(1)
+
+    def __init__(self, nb, name):
+        self.nb, self.name, self.rows = nb, name, []
+
+    def _value(self, row, key):
+        # manufacturer_id -> row.manufacturer.id; pozostałe *_id to zwykłe atrybuty
+        if key == "manufacturer_id":
+            return row.manufacturer.id
+        return getattr(row, key, None)
+
+    def _match(self, row, kw):
+        for key, want in kw.items():
+            if key == "limit":
+                continue
+            have = self._value(row, key)
+            if (have not in want) if isinstance(want, list) else (have != want):
+                return False
+        return True
+
+    def filter(self, **kw):
+        self.nb.requests.append(("GET", self.name, kw))
+        return [r for r in self.rows if self._match(r, kw)]
+
+    def get(self, **kw):
+        self.nb.requests.append(("GET", self.name, kw))
+        return next((r for r in self.rows if self._match(r, kw)), None)
+
+    def add(self, **data):
+        rec = FakeRecord(self, id=next(self.ids), **data)
+        self.rows.append(rec)
+        return rec
+
+    def create(self, data):
+        self.nb.requests.append(("POST", self.name, data))
+        many = isinstance(data, list)
+        out = []
+        for d in (data if many else [data]):
+            d = dict(d)
+            if "manufacturer" in d:
+                d["manufacturer"] = SimpleNamespace(id=d["manufacturer"])
+            out.append(self.add(**d))
+        return out if many else out[0]
+
+class FakeNetBox:
+    def __init__(self):
+        self.requests = []
+        self.dcim = SimpleNamespace(**{name: FakeEndpoint(self, name) for name in (
+            "devices", "sites", "manufacturers", "platforms", "device_roles", "device_types", "interfaces")})
+        self.ipam = SimpleNamespace(ip_addresses=FakeEndpoint(self, "ip_addresses"))
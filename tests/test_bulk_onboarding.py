@@ -0,0 +1,58 @@
+from fake_netbox import FakeNetBox
+from models import Facts
+from netbox_utils.dcim.device import ensure_devices_registered
+
+MODELS = [("Cisco", "C9300-48P", "switch"), ("Cisco", "ISR4331", "router"), ("Dell", "S5248F-ON", "switch")]
+
+def site_devices(count):
+    devices = []
+    for i in range(count):
+        vendor, model, role = MODELS[i % len(MODELS)]
+        device_type = "cisco_ios" if vendor == "Cisco" else "dell_os10"
+        devices.append((f"DEV{i:04d}", device_type,
+                        Facts(hostname=f"DEV{i:04d}", vendor=vendor, model=model, device_role=role, serial_number=f"SN{i}")))
+    return devices
+
+def test_500_devices_request_count_and_rerun():
+    nb = FakeNetBox()
+    devices = site_devices(500)
+
+    found, created, rejected = ensure_devices_registered(nb, devices)
+
+    # 5 lookups + site 3 + manufacturers 3 + platforms 2 + roles 3 + device types 2 + 1 bulk POST
+    assert len(nb.requests) == 19
+    assert len(created) == 500 and len(found) == 500 and rejected == {}
+    assert len(nb.dcim.manufacturers.rows) == 2 and len(nb.dcim.device_types.rows) == 3
+
+    nb.requests.clear()
+    found, created, rejected = ensure_devices_registered(nb, devices)
+
+    # re-run: only the 5 batched name lookups
+    assert len(nb.requests) == 5
+    assert created == [] and len(found) == 500
+
+def test_existing_manufacturer_and_role_with_other_slugs_are_reused():
+    nb = FakeNetBox()
+    cisco = nb.dcim.manufacturers.add(name="Cisco", slug="cisco-systems")
+    role = nb.dcim.device_roles.add(name="switch", slug="access-switch")
+
+    _, created, _ = ensure_devices_registered(nb, site_devices(1))
+
+    assert created == ["DEV0000"]
+    assert nb.dcim.manufacturers.rows == [cisco] and nb.dcim.device_roles.rows == [role]
+    dev = nb.dcim.devices.rows[0]
+    assert dev.role == role.id
+    assert nb.dcim.device_types.rows[0].manufacturer.id == cisco.id
+
+def test_invalid_record_is_rejected_without_aborting_the_batch():
+    nb = FakeNetBox()
+    devices = site_devices(3) + [
+        ("NOVENDOR", "cisco_ios", Facts(hostname="NOVENDOR", model="X1")),
+        ("NOFACTS", "cisco_ios", None),
+    ]
+
+    found, created, rejected = ensure_devices_registered(nb, devices)
+
+    assert rejected == {"NOVENDOR": "missing vendor", "NOFACTS": "missing facts"}
+    assert created == ["DEV0000", "DEV0001", "DEV0002"]
+    assert set(found) == set(created)
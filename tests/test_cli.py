@@ -0,0 +1,21 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import cli
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def test_since_process_start_includes_time_before_cli_import():
+    code = "import time; time.sleep(0.3); import cli; print(cli._since_process_start())"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert float(out.stdout) >= 0.3
+
+@pytest.mark.parametrize("loader", sorted(n for n in dir(cli) if n.startswith("_load_")))
+def test_every_loader_is_a_subcommand(loader):
+    command = loader[len("_load_"):].replace("_", "-")
+    with pytest.raises(SystemExit) as exc:
+        cli.build_parser().parse_args([command, "--help"])
+    assert exc.value.code == 0
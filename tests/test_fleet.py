@@ -0,0 +1,70 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import fleet
+from fake_netbox import FakeNetBox
+from fleet import run_jobs, sync_fleet
+from models import Facts
+
+def whoami(name, fail=False):
+    if fail:
+        raise RuntimeError(f"{name} unreachable")
+    return name, os.getpid()
+
+def test_run_jobs_inline():
+    results = run_jobs(whoami, {"a": ("a",), "b": ("b", True)})
+    assert results["a"] == ("a", os.getpid())
+    assert isinstance(results["b"], RuntimeError)
+
+def test_run_jobs_uses_worker_processes():
+    jobs = {f"SW{i}": (f"SW{i}",) for i in range(8)}
+    jobs["BAD"] = ("BAD", True)
+
+    with ProcessPoolExecutor(2) as ex:
+        results = run_jobs(whoami, jobs, ex)
+
+    assert str(results.pop("BAD")) == "BAD unreachable"
+    assert {name for name, _ in results.values()} == {f"SW{i}" for i in range(8)}
+    assert os.getpid() not in {pid for _, pid in results.values()}
+
+def row(name, host, device_type="cisco_ios"):
+    return {"device_type": device_type, "device_name": name, "host": host}
+
+def test_sync_fleet_reports_failed_devices(monkeypatch):
+    calls = []
+
+    def fake_start(device_type, device_name, host, stream):
+        calls.append((device_type, device_name, host, stream))
+        if device_name == "R1":
+            raise ConnectionError("ssh refused")
+
+    monkeypatch.setattr(fleet, "start", fake_start)
+    nb = FakeNetBox()
+    nb.dcim.devices.add(name="SW1")
+    nb.dcim.devices.add(name="R1")
+
+    failed = sync_fleet([row("SW1", "10.0.0.1"), row("R1", "10.0.0.2")], stream=True, nb=nb)
+
+    assert list(failed) == ["R1"]
+    assert calls == [("cisco_ios", "SW1", "10.0.0.1", True), ("cisco_ios", "R1", "10.0.0.2", True)]
+    assert not [r for r in nb.requests if r[0] == "POST"]
+
+def test_sync_fleet_onboards_missing_devices_in_bulk(monkeypatch):
+    facts = {
+        "10.0.0.2": Facts(hostname="SW2", vendor="Cisco", model="C9300-48P", device_role="switch"),
+        "10.0.0.3": Facts(hostname="SW3", vendor="Cisco", model="C9300-48P", device_role="switch"),
+        "10.0.0.4": Facts(hostname="X", vendor=None, model="Unknown"),
+    }
+    synced = []
+    monkeypatch.setattr(fleet, "collect_facts", lambda device_type, host: facts[host])
+    monkeypatch.setattr(fleet, "start", lambda device_type, name, host, stream: synced.append(name))
+    nb = FakeNetBox()
+    nb.dcim.devices.add(name="SW1")
+
+    rows = [row("SW1", "10.0.0.1"), row("SW2", "10.0.0.2"), row("SW3", "10.0.0.3"), row("X", "10.0.0.4")]
+    failed = sync_fleet(rows, nb=nb)
+
+    assert list(failed) == ["X"] and "vendor" in str(failed["X"])
+    assert synced == ["SW1", "SW2", "SW3"]
+    posts = [d for method, endpoint, d in nb.requests if (method, endpoint) == ("POST", "devices")]
+    assert [[d["name"] for d in batch] for batch in posts] == [["SW2", "SW3"]]
@@ -0,0 +1,51 @@
+from models import Facts, Interface
+from parsers.minimize import minimize_section
+
+CISCO = """interface GigabitEthernet0/1.10
+ description Uplink
+ encapsulation dot1Q 10
+ ip address 10.0.10.1 255.255.255.0
+ spanning-tree portfast
+ cdp enable
+!"""
+
+def test_cisco_interface_keeps_only_schema_lines():
+    assert minimize_section(CISCO, Interface, "cisco_ios") == (
+        "interface GigabitEthernet0/1.10\n description Uplink\n encapsulation dot1Q 10\n ip address 10.0.10.1 255.255.255.0"
+    )
+
+DELL = """Ethernet 1/1/1 is up, line protocol is up
+Description: uplink
+Hardware is Eth, address is 14:18:77:09:ae:01
+    Current address is 14:18:77:09:ae:01
+Pluggable media present, QSFP28 type is QSFP28 100GBASE-CR4-2M
+Interface index is 17305068
+Internet address is 10.1.1.1/24
+MTU 1532 bytes, IP MTU 1500 bytes
+LineSpeed 100G, Auto-Negotiation on
+Flowcontrol rx off tx off
+Input statistics:
+     12345 packets, 1234567 octets"""
+
+def test_dell_interface_keeps_speed_and_status_lines():
+    assert minimize_section(DELL, Interface, "dell_os10") == (
+        "Ethernet 1/1/1 is up, line protocol is up\n"
+        "Description: uplink\n"
+        "Hardware is Eth, address is 14:18:77:09:ae:01\n"
+        "    Current address is 14:18:77:09:ae:01\n"
+        "Internet address is 10.1.1.1/24\n"
+        "MTU 1532 bytes, IP MTU 1500 bytes\n"
+        "LineSpeed 100G, Auto-Negotiation on"
+    )
+
+def test_vendors_without_rules_only_drop_noise():
+    junos = "ge-0/0/0 {\n    unit 0 {\n        family inet {\n            address 10.0.0.1/24;\n        }\n    }\n}\n# comment"
+    huawei = "interface GigabitEthernet0/0/1\n undo shutdown\n ip address 10.0.0.1 255.255.255.0\n#"
+
+    assert minimize_section(junos, Interface, "juniper_junos") == junos.rsplit("\n", 1)[0]
+    assert minimize_section(huawei, Interface, "huawei") == huawei.rsplit("\n", 1)[0]
+    assert minimize_section(huawei, Interface, None) == huawei.rsplit("\n", 1)[0]
+
+def test_facts_drops_legal_text():
+    ver = "Cisco IOS Software, Version 15.0(2)SE\nCopyright (c) 1986-2012 by Cisco Systems, Inc.\nSWITCH uptime is 1 week"
+    assert minimize_section(ver, Facts, "cisco_ios") == "Cisco IOS Software, Version 15.0(2)SE\nSWITCH uptime is 1 week"
@@ -0,0 +1,45 @@
+import pytest
+
+from fake_netbox import FakeNetBox
+from netbox_utils.state import load_device_state
+
+def make_device(nb, ports):
+    device = nb.dcim.devices.add(name="SW")
+    other = nb.dcim.devices.add(name="OTHER")
+    ifaces = [nb.dcim.interfaces.add(device_id=device.id, name=f"Gi0/{i}", custom_fields={"cli_hash": f"h{i}"})
+              for i in range(ports)]
+    nb.dcim.interfaces.add(device_id=other.id, name="Gi0/0", custom_fields={})
+    for i, iface in enumerate(ifaces[:3]):
+        nb.ipam.ip_addresses.add(device_id=device.id, address=f"10.0.0.{i}/24",
+                                 assigned_object_type="dcim.interface", assigned_object_id=iface.id)
+    nb.ipam.ip_addresses.add(device_id=device.id, address="10.9.9.9/24",
+                             assigned_object_type="virtualization.vminterface", assigned_object_id=ifaces[0].id)
+    return device, ifaces
+
+@pytest.mark.parametrize("ports", [3, 48, 2000])
+def test_three_list_calls_regardless_of_port_count(ports):
+    nb = FakeNetBox()
+    make_device(nb, ports)
+
+    state = load_device_state(nb, "SW")
+
+    assert [(method, endpoint) for method, endpoint, _ in nb.requests] == [
+        ("GET", "devices"), ("GET", "interfaces"), ("GET", "ip_addresses")]
+    assert len(state.interfaces) == ports
+
+def test_indexes_interfaces_and_ips():
+    nb = FakeNetBox()
+    device, ifaces = make_device(nb, 5)
+
+    state = load_device_state(nb, "SW")
+
+    assert state.device is device
+    assert state.cli_hash("Gi0/4") == "h4"
+    assert [ip.address for ip in state.interface_ips(ifaces[0].id)] == ["10.0.0.0/24"]
+    assert state.ip(ifaces[2].id, "10.0.0.2/24").assigned_object_id == ifaces[2].id
+    assert state.interface_ips(ifaces[4].id) == []
+
+def test_missing_device():
+    nb = FakeNetBox()
+    assert load_device_state(nb, "NOPE") is None
+    assert len(nb.requests) == 1
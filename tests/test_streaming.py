@@ -0,0 +1,75 @@
+import time
+
+import pytest
+from netmiko.exceptions import ReadTimeout
+
+from device_io.ssh import stream_command, stream_commands
+from device_io.utils import iter_interface_sections
+
+class FakeChannel:
+    """Netmiko-like connection replaying scripted read_channel() chunks ('' = nothing to read yet)."""
+
+    def __init__(self, outputs):
+        self.outputs = outputs  # command -> list of chunks
+        self.chunks = []
+
+    def find_prompt(self):
+        return "SW#"
+
+    def normalize_cmd(self, command):
+        return command + "\n"
+
+    def strip_ansi_escape_codes(self, text):
+        return text
+
+    def write_channel(self, data):
+        self.chunks = list(self.outputs[data.strip()])
+
+    def read_channel(self):
+        return self.chunks.pop(0) if self.chunks else ""
+
+CONFIG = "interface Gi0/1\r\n description A\r\ninterface Gi0/2\r\n description B\r\n"
+STATUS = "Gi0/1 is up, line protocol is up\r\n  Hardware is X, address is 0011.2233.4455\r\n"
+OUTPUTS = {
+    "show run | section interface": ["SW#show run | section interface\r\n", CONFIG, "S", "W#"],
+    "show interfaces": ["SW#show interfaces\r\n" + STATUS + "SW#"],
+}
+
+def test_skips_echo_strips_cr_and_stops_at_split_prompt():
+    lines = list(stream_command(FakeChannel(OUTPUTS), "show run | section interface", poll=0))
+    assert lines == ["interface Gi0/1", " description A", "interface Gi0/2", " description B"]
+
+def test_lines_split_across_chunks():
+    chunks = ["SW#show run | section interface\r\ninterf", "ace Gi0/1\r", "\n description A\r\nSW#"]
+    lines = list(stream_command(FakeChannel({"show run | section interface": chunks}),
+                                "show run | section interface", poll=0))
+    assert lines == ["interface Gi0/1", " description A"]
+
+def test_stream_commands_marks_command_boundary():
+    lines = list(stream_commands(FakeChannel(OUTPUTS), ["show run | section interface", "show interfaces"]))
+    assert lines[0] == "### COMMAND: show run | section interface"
+    assert "### COMMAND: show interfaces" in lines
+    assert lines[-1] == "  Hardware is X, address is 0011.2233.4455"
+
+def test_last_section_ends_at_next_command():
+    streamed = list(iter_interface_sections(
+        stream_commands(FakeChannel(OUTPUTS), ["show run | section interface", "show interfaces"])))
+    assert streamed == [("Gi0/1", "interface Gi0/1\n description A"), ("Gi0/2", "interface Gi0/2\n description B")]
+
+    # run_command() format used by the default (non-stream) path gives the same sections
+    collected = (f"\n### COMMAND: show run | section interface\n{CONFIG.replace(chr(13), '')}"
+                 f"\n\n### COMMAND: show interfaces\n{STATUS.replace(chr(13), '')}")
+    assert list(iter_interface_sections(collected.splitlines())) == streamed
+
+def test_times_out_when_channel_stays_idle():
+    chan = FakeChannel({"show interfaces": ["SW#show interfaces\r\n", "Gi0/1 is up\r\n"]})
+    with pytest.raises(ReadTimeout):
+        list(stream_command(chan, "show interfaces", read_timeout=0.05, poll=0.01))
+
+def test_consumer_time_does_not_count_as_idle():
+    chan = FakeChannel({"show interfaces": ["SW#show interfaces\r\n", "Gi0/1 is up\r\n", "", "SW#"]})
+    lines = []
+    for line in stream_command(chan, "show interfaces", read_timeout=0.05, poll=0.01):
+        time.sleep(0.1)  # e.g. LLM call + NetBox write for the yielded section
+        lines.append(line)
+    assert lines == ["Gi0/1 is up"]
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import main
+from models import IPv4, Interface
+from netbox_utils.state import DeviceState
+
+class FakeRecord(SimpleNamespace):
+    def __init__(self, endpoint, **kw):
+        super().__init__(**kw)
+        self._endpoint = endpoint
+
+    def delete(self):
+        self._endpoint.rows.remove(self)
+        self._endpoint.deleted.append(self.address)
+        return True
+
+    def update(self, data):
+        for k, v in data.items():
+            setattr(self, k, v)
+        return True
+
+    def save(self):
+        return True
+
+class FakeEndpoint:
+    def __init__(self):
+        self.rows, self.created, self.deleted = [], [], []
+
+    def filter(self, **kw):
+        return [r for r in self.rows if all(getattr(r, k, None) == v for k, v in kw.items())]
+
+    def create(self, data):
+        rec = FakeRecord(self, id=100 + len(self.created), assigned_object=None, **data)
+        self.rows.append(rec)
+        self.created.append(data["address"])
+        return rec
+
+def make_state(ip_endpoint, *addresses):
+    iface = FakeRecord(None, id=7, name="Gi0/1", description="", enabled=True, mtu=None,
+                       custom_fields={"cli_hash": "old"})
+    ips = []
+    for i, address in enumerate(addresses):
+        ip = FakeRecord(ip_endpoint, id=i + 1, address=address, assigned_object=iface,
+                        assigned_object_id=iface.id, assigned_object_type="dcim.interface")
+        ip_endpoint.rows.append(ip)
+        ips.append(ip)
+    device = SimpleNamespace(id=1, name="SW", update=lambda data: True)
+    state = DeviceState(device=device, interfaces={"Gi0/1": iface}, ips={iface.id: ips})
+    return device, state
+
+def run_sync(ip_endpoint, device, state, *addresses):
+    nb = SimpleNamespace(ipam=SimpleNamespace(ip_addresses=ip_endpoint))
+    parsed = Interface(name="Gi0/1", ipv4=[IPv4(address=a) for a in addresses])
+    with patch.object(main, "parse_cli_to_model", return_value=parsed):
+        main.sync_interface(nb, device, state, "Gi0/1", "interface Gi0/1\n ip address ...")
+
+def test_ip_still_on_interface_is_kept():
+    ips = FakeEndpoint()
+    device, state = make_state(ips, "10.0.0.1/24", "10.0.0.2/24")
+
+    run_sync(ips, device, state, "10.0.0.1/24")
+
+    assert ips.deleted == ["10.0.0.2/24"]
+    assert ips.created == []
+    assert [ip.address for ip in state.interface_ips(7)] == ["10.0.0.1/24"]
+
+def test_deleted_ip_is_not_reused_and_new_ip_is_created():
+    ips = FakeEndpoint()
+    device, state = make_state(ips, "10.0.0.1/24")
+
+    run_sync(ips, device, state, "10.0.0.9/24")
+
+    assert ips.deleted == ["10.0.0.1/24"]
+    assert ips.created == ["10.0.0.9/24"]
+    assert state.interface_ips(7) == []
+    assert state.cli_hash("Gi0/1") != "old"